@@ -1,17 +1,19 @@
-from typing import override
+import time
 
-import pygame as pg
+# Taken before the imports, so the startup timing includes them
+STARTED_AT = time.perf_counter()
 
-from mvpygame.mvp.m import GameModel, GameState
-from mvpygame.mvp.p import GamePresenter
-from mvpygame.mvp.v import GameView
-from mvpygame.sprite import AnchorPoint, Sprite
-from mvpygame.subject import MutableSubject
-from mvpygame.utils import unwrap
+from typing import override  # noqa: E402
 
-pg.init()
-pg.font.init()
-pg.display.set_caption("Dino Game")
+import pygame as pg  # noqa: E402
+
+from mvpygame.bootstrap import Bootstrap, Subsystem  # noqa: E402
+from mvpygame.mvp.m import GameModel, GameState  # noqa: E402
+from mvpygame.mvp.p import GamePresenter  # noqa: E402
+from mvpygame.mvp.v import GameView  # noqa: E402
+from mvpygame.sprite import AnchorPoint, Sprite  # noqa: E402
+from mvpygame.subject import MutableSubject  # noqa: E402
+from mvpygame.utils import unwrap  # noqa: E402
 
 
 def between[T: int | float](value: T, min_value: T, max_value: T) -> T:
@@ -180,8 +182,12 @@ class DinoPresenter(GamePresenter):
 
 
 if __name__ == "__main__":
+    bootstrap = Bootstrap(Subsystem.DISPLAY, Subsystem.FONT, started_at=STARTED_AT).init()
+    pg.display.set_caption("Dino Game")
     view = GameView(pg.display.set_mode((800, 600)))
+    bootstrap.watch(view)
     model = DinoModel((800, 600))
     view.size_subject.attach(model.on_resize)
     presenter = DinoPresenter(view, model, pg.display.get_surface(), pg.time.Clock(), 60)
     presenter.run()
+    print(bootstrap.summary())
@@ -0,0 +1,112 @@
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum, auto
+from typing import Any, Callable, Optional
+
+import pygame as pg
+
+from mvpygame.mvp.v import GameView
+from mvpygame.subject import MutableSubject
+
+
+class Subsystem(Enum):
+    """Pygame Subsystem Enum"""
+
+    DISPLAY = auto()
+    FONT = auto()
+    MIXER = auto()
+    JOYSTICK = auto()
+
+
+_INITIALIZERS: dict[Subsystem, Callable[[], Any]] = {
+    Subsystem.DISPLAY: pg.display.init,
+    Subsystem.FONT: pg.font.init,
+    Subsystem.MIXER: pg.mixer.init,
+    Subsystem.JOYSTICK: pg.joystick.init,
+}
+
+
+class AssetLoader:
+    """Load assets on a background thread pool
+
+    Factories run on worker threads. Call `poll` from the game loop to publish the
+    progress on the main thread, so observers can safely draw a loading screen.
+    Progress stays at 0.0 and `done` is False until an asset has been submitted.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="asset")
+        self._futures: dict[str, Future] = {}
+        self.progress_subject = MutableSubject[float](0.0)
+
+    def submit(self, name: str, factory: Callable[[], Any]) -> None:
+        """Schedule an asset to be created by `factory`"""
+        if name in self._futures:
+            raise ValueError(f"Asset {name!r} has already been submitted")
+        self._futures[name] = self._executor.submit(factory)
+        self.poll()
+
+    @property
+    def done(self) -> bool:
+        """Whether assets have been submitted and all of them have been loaded"""
+        return bool(self._futures) and all(future.done() for future in self._futures.values())
+
+    def poll(self) -> float:
+        """Publish and return the fraction of assets loaded"""
+        total = len(self._futures)
+        finished = sum(future.done() for future in self._futures.values())
+        self.progress_subject.value = finished / total if total else 0.0
+        return self.progress_subject.value
+
+    def get(self, name: str) -> Any:
+        """Get a loaded asset, waiting for it if necessary"""
+        return self._futures[name].result()
+
+    def shutdown(self) -> None:
+        """Wait for pending assets and release the worker threads"""
+        self._executor.shutdown(wait=True)
+
+
+class Bootstrap:
+    """Initialize only the pygame subsystems a game needs, and time the startup
+
+    Times are measured in milliseconds from `started_at`, a `time.perf_counter()`
+    value. Take it at the very top of the entry script, before importing pygame,
+    so that `first_frame_ms` covers imports, subsystem init, model construction
+    and the first flip. It defaults to the construction of the `Bootstrap`,
+    which leaves out the imports.
+    """
+
+    def __init__(
+        self, *subsystems: Subsystem, headless: bool = False, started_at: Optional[float] = None
+    ):
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self.subsystems = subsystems
+        self.headless = headless
+        self.init_ms: Optional[float] = None
+        self.first_frame_ms: Optional[float] = None
+
+    def init(self) -> "Bootstrap":
+        """Initialize the declared subsystems"""
+        if self.headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        for subsystem in self.subsystems:
+            _INITIALIZERS[subsystem]()
+        self.init_ms = (time.perf_counter() - self.started_at) * 1000.0
+        return self
+
+    def summary(self) -> str:
+        """Describe the startup timings"""
+        init = f"{self.init_ms:.1f} ms" if self.init_ms is not None else "n/a"
+        first_frame = f"{self.first_frame_ms:.1f} ms" if self.first_frame_ms is not None else "n/a"
+        return f"Startup: init {init}, first frame {first_frame}"
+
+    def watch(self, view: GameView) -> None:
+        """Record the time to the first frame presented by `view`"""
+        view.frame_subject.attach(self._on_frame)
+
+    def _on_frame(self, frame: int) -> None:
+        if frame > 0 and self.first_frame_ms is None:
+            self.first_frame_ms = (time.perf_counter() - self.started_at) * 1000.0
@@ -0,0 +1,226 @@
+import multiprocessing as mp
+import queue
+import subprocess
+import time
+from enum import Enum, auto
+from multiprocessing import shared_memory
+from typing import Sequence
+
+import pygame as pg
+
+PIXEL_FORMAT = "RGBA"
+BYTES_PER_PIXEL = 4
+
+
+class CaptureFormat(Enum):
+    """Capture Output Format Enum"""
+
+    PNG = auto()
+    RAW = auto()
+    PIPE = auto()
+
+
+class Backpressure(Enum):
+    """Behavior when the ring buffer is full"""
+
+    DROP = auto()
+    BLOCK = auto()
+
+
+def _encode(
+    shm_name: str,
+    size: tuple[int, int],
+    capture_format: CaptureFormat,
+    target: str | Sequence[str],
+    frames: mp.Queue,
+    results: mp.Queue,
+    free_slots,
+) -> None:
+    """Encoder process: drain frames from the ring buffer and write them out"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frame_bytes = size[0] * size[1] * BYTES_PER_PIXEL
+    sink = None
+    try:
+        match capture_format:
+            case CaptureFormat.RAW:
+                sink = open(target, "wb")
+            case CaptureFormat.PIPE:
+                sink = subprocess.Popen(target, stdin=subprocess.PIPE)
+        results.put(None)  # Ready handshake
+        while (item := frames.get()) is not None:
+            slot, index, captured_at = item
+            with shm.buf[slot * frame_bytes : (slot + 1) * frame_bytes] as pixels:
+                match capture_format:
+                    case CaptureFormat.PNG:
+                        image = pg.image.frombuffer(bytes(pixels), size, PIXEL_FORMAT)
+                        pg.image.save(image, str(target).format(index))
+                    case CaptureFormat.RAW:
+                        sink.write(pixels)
+                    case CaptureFormat.PIPE:
+                        sink.stdin.write(pixels)
+            free_slots.release()
+            results.put((time.monotonic() - captured_at) * 1000.0)
+    finally:
+        if isinstance(sink, subprocess.Popen):
+            try:
+                sink.stdin.close()
+            except BrokenPipeError:
+                pass
+            sink.wait()
+        elif sink is not None:
+            sink.close()
+        shm.close()
+
+
+class FrameCapture:
+    """Stream frames to disk from a separate encoder process
+
+    Each frame is blitted into a slot of a shared-memory ring buffer, which costs
+    the game loop a single copy. `target` is a filename pattern such as
+    "frames/{:06d}.png" for PNG, a file path for RAW, or an encoder command line
+    reading raw RGBA frames from stdin for PIPE.
+
+    The constructor returns once the encoder is ready. Frames that do not match
+    `size`, such as after a window resize, are skipped and counted in
+    `mismatched_frames`. If the encoder process exits, `write` raises
+    `RuntimeError` rather than dropping or blocking forever. Call `close` to
+    flush pending frames and release the shared memory; an encoder that does not
+    finish within `close_timeout` seconds is terminated.
+    """
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        target: str | Sequence[str],
+        capture_format: CaptureFormat = CaptureFormat.PNG,
+        backpressure: Backpressure = Backpressure.DROP,
+        slots: int = 8,
+        smoothing: float = 0.1,
+        poll_interval: float = 0.1,
+        close_timeout: float = 5.0,
+    ):
+        self.size = size
+        self.backpressure = backpressure
+        self.slots = slots
+        self.smoothing = smoothing
+        self.poll_interval = poll_interval
+        self.close_timeout = close_timeout
+        self.closed = False
+        self.frame_bytes = size[0] * size[1] * BYTES_PER_PIXEL
+        self.captured_frames = 0
+        self.dropped_frames = 0
+        self.mismatched_frames = 0
+        self.encoded_frames = 0
+        self.write_ms = 0.0
+        self.latency_ms = 0.0
+        self._head = 0
+        self._shm = shared_memory.SharedMemory(create=True, size=self.frame_bytes * slots)
+        self._slot_buffers = [
+            self._shm.buf[slot * self.frame_bytes : (slot + 1) * self.frame_bytes]
+            for slot in range(slots)
+        ]
+        self._slot_surfaces = [
+            pg.image.frombuffer(buffer, size, PIXEL_FORMAT) for buffer in self._slot_buffers
+        ]
+        ctx = mp.get_context("spawn")
+        self._frames = ctx.Queue()
+        self._results = ctx.Queue()
+        self._free_slots = ctx.Semaphore(slots)
+        self._process = ctx.Process(
+            target=_encode,
+            args=(
+                self._shm.name,
+                size,
+                capture_format,
+                target,
+                self._frames,
+                self._results,
+                self._free_slots,
+            ),
+            daemon=True,
+        )
+        self._process.start()
+        try:
+            self._wait_ready()
+        except BaseException:
+            self.close()
+            raise
+
+    def _wait_ready(self) -> None:
+        """Wait for the encoder handshake, raising if the encoder process exits first"""
+        while True:
+            try:
+                self._results.get(timeout=self.poll_interval)
+                return
+            except queue.Empty:
+                self._check_encoder()
+
+    def write(self, surface: pg.Surface) -> bool:
+        """Copy a frame into the ring buffer, and return whether it was captured"""
+        if self.closed:
+            raise ValueError("Cannot write to a closed FrameCapture")
+        if surface.get_size() != self.size:
+            self.mismatched_frames += 1
+            return False
+        if not self._acquire_slot():
+            self.dropped_frames += 1
+            return False
+        started_at = time.monotonic()
+        slot = self._head
+        self._head = (self._head + 1) % self.slots
+        self._slot_surfaces[slot].blit(surface, (0, 0))
+        self._frames.put((slot, self.captured_frames, started_at))
+        self.captured_frames += 1
+        write_ms = (time.monotonic() - started_at) * 1000.0
+        self.write_ms += self.smoothing * (write_ms - self.write_ms)
+        self.poll()
+        return True
+
+    def _acquire_slot(self) -> bool:
+        """Acquire a free slot, raising if the encoder process has exited"""
+        match self.backpressure:
+            case Backpressure.DROP:
+                if self._free_slots.acquire(block=False):
+                    return True
+                self._check_encoder()
+                return False
+            case Backpressure.BLOCK:
+                while not self._free_slots.acquire(timeout=self.poll_interval):
+                    self._check_encoder()
+                return True
+
+    def _check_encoder(self) -> None:
+        if not self._process.is_alive():
+            raise RuntimeError(f"Capture encoder process exited with code {self._process.exitcode}")
+
+    def poll(self) -> float:
+        """Collect encoder results, and return the moving capture latency in milliseconds"""
+        while True:
+            try:
+                latency_ms = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self.encoded_frames += 1
+            self.latency_ms += self.smoothing * (latency_ms - self.latency_ms)
+        return self.latency_ms
+
+    def close(self) -> None:
+        """Flush pending frames and stop the encoder process"""
+        if self.closed:
+            return
+        self.closed = True
+        if self._process.is_alive():
+            self._frames.put(None)
+        self._process.join(self.close_timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self.poll()
+        for channel in (self._frames, self._results):
+            channel.close()
+            channel.join_thread()
+        self._slot_surfaces.clear()
+        for buffer in self._slot_buffers:
+            buffer.release()
+        self._shm.close()
+        self._shm.unlink()
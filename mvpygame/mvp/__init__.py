@@ -1,4 +1,4 @@
 from . import *
 from .m import GameModel
-from .p import GamePresenter
+from .p import FramePacer, GamePresenter
 from .v import GameView
@@ -1,24 +1,162 @@
+from typing import Optional
+
 import pygame as pg
 
 from mvpygame.mvp.m import GameModel
 from mvpygame.mvp.v import GameView
 
 
+class FramePacer:
+    """Frame pacing controller
+
+    Tracks how far the loop lags behind the schedule of the target FPS. With
+    `max_skip_frames` set, rendering is skipped while the loop is a frame or more
+    behind, and the frame after a skip is not throttled, so model updates catch
+    up. With `min_fps` set, the target FPS is lowered once rendered frames have
+    not fit the budget for `overload_frames` ticks, and raised again once they do.
+    """
+
+    def __init__(
+        self,
+        clock: pg.time.Clock,
+        fps: int,
+        min_fps: Optional[int] = None,
+        busy_loop: bool = False,
+        smoothing: float = 0.1,
+        max_skip_frames: int = 0,
+        jitter_tolerance_ms: float = 2.0,
+        overload_frames: int = 30,
+    ):
+        self.clock = clock
+        self.fps = fps
+        self.target_fps = fps
+        self.min_fps = min_fps if min_fps is not None else fps
+        self.busy_loop = busy_loop
+        self.smoothing = smoothing
+        self.max_skip_frames = max_skip_frames
+        self.jitter_tolerance_ms = jitter_tolerance_ms
+        self.overload_frames = overload_frames
+        self.frame_time_ms = 1000.0 / fps
+        self.render_time_ms = 1000.0 / fps
+        self.jitter_ms = 0.0
+        self.lag_ms = 0.0
+        self.frames = 0
+        self.skipped_frames = 0
+        self.jitter_frames = 0
+        self._consecutive_skips = 0
+        self._overloaded_ticks = 0
+        self._recovered_ticks = 0
+        self._should_render = True
+
+    @property
+    def budget_ms(self) -> float:
+        """Frame budget of the current target FPS in milliseconds"""
+        return 1000.0 / self.target_fps
+
+    @property
+    def overloaded(self) -> bool:
+        """Whether the averaged frame time exceeds the frame budget"""
+        return self.frame_time_ms > self.budget_ms + self.jitter_tolerance_ms
+
+    @property
+    def should_render(self) -> bool:
+        """Whether the current frame should be rendered"""
+        return self._should_render
+
+    def tick(self) -> float:
+        """Wait for the next frame and return the elapsed time in seconds"""
+        framerate = self.target_fps if self._should_render else 0
+        if self.busy_loop:
+            elapsed_ms = self.clock.tick_busy_loop(framerate)
+        else:
+            elapsed_ms = self.clock.tick(framerate)
+        self.frames += 1
+        self._track(elapsed_ms)
+        self._adapt()
+        self._decide_render()
+        return elapsed_ms / 1000.0
+
+    def _track(self, elapsed_ms: float) -> None:
+        """Update the lag, moving frame time, and the jitter and work time of rendered frames"""
+        max_lag_ms = self.budget_ms * self.max_skip_frames
+        self.lag_ms = min(max(self.lag_ms + elapsed_ms - self.budget_ms, 0.0), max_lag_ms)
+        self.frame_time_ms += self.smoothing * (elapsed_ms - self.frame_time_ms)
+        if not self._should_render:
+            return
+        deviation = abs(elapsed_ms - self.budget_ms)
+        if deviation > self.jitter_tolerance_ms:
+            self.jitter_frames += 1
+        self.jitter_ms += self.smoothing * (deviation - self.jitter_ms)
+        render_ms = self.clock.get_rawtime()
+        self.render_time_ms += self.smoothing * (render_ms - self.render_time_ms)
+
+    def _adapt(self) -> None:
+        """Lower the target FPS under sustained load, and raise it back once recovered"""
+        if self.min_fps >= self.fps:
+            return
+        if self.render_time_ms > self.budget_ms + self.jitter_tolerance_ms:
+            self._overloaded_ticks += 1
+            self._recovered_ticks = 0
+        elif (
+            self.target_fps < self.fps
+            and self.render_time_ms + self.jitter_tolerance_ms < 1000.0 / (self.target_fps + 1)
+        ):
+            self._recovered_ticks += 1
+            self._overloaded_ticks = 0
+        else:
+            self._overloaded_ticks = self._recovered_ticks = 0
+        if self._overloaded_ticks >= self.overload_frames:
+            sustainable_fps = int(1000.0 / self.render_time_ms)
+            self.target_fps = max(min(self.target_fps - 1, sustainable_fps), self.min_fps)
+            self._overloaded_ticks = 0
+            self.lag_ms = 0.0
+        elif self._recovered_ticks >= self.overload_frames:
+            self.target_fps = min(self.target_fps + 1, self.fps)
+            self._recovered_ticks = 0
+            self.lag_ms = 0.0
+
+    def _decide_render(self) -> None:
+        """Skip rendering while a frame behind, but never for too many frames in a row"""
+        if self.lag_ms >= self.budget_ms and self._consecutive_skips < self.max_skip_frames:
+            self._should_render = False
+            self._consecutive_skips += 1
+            self.skipped_frames += 1
+        else:
+            self._should_render = True
+            self._consecutive_skips = 0
+
+
 class GamePresenter:
     def __init__(
-        self, view: GameView, model: GameModel, screen: pg.Surface, clock: pg.time.Clock, fps: int
+        self,
+        view: GameView,
+        model: GameModel,
+        screen: pg.Surface,
+        clock: pg.time.Clock,
+        fps: int,
+        pacer: Optional[FramePacer] = None,
     ):
         self.view = view
         self.model = model
         self.screen = screen
-        self.clock = clock
-        self.fps = fps
+        self.pacer = pacer or FramePacer(clock, fps)
         self.running = True
 
+    @property
+    def clock(self) -> pg.time.Clock:
+        """Clock driving the loop"""
+        return self.pacer.clock
+
+    @property
+    def fps(self) -> int:
+        """Target FPS of the loop"""
+        return self.pacer.target_fps
+
     def update(self):
-        dt = self.clock.tick(self.fps) / 1000.0
+        dt = self.pacer.tick()
         self.model.update(dt)
-        self.view.update(self.model.sprites)
+        if self.pacer.should_render:
+            self.view.update(self.model.sprites)
         for event in pg.event.get():
             if event.type == pg.QUIT:
                 self.running = False
@@ -27,5 +165,8 @@ class GamePresenter:
         self.model.handle_key_presses(keys)
 
     def run(self):
-        while self.running:
-            self.update()
+        try:
+            while self.running:
+                self.update()
+        finally:
+            self.view.close()
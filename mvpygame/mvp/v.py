@@ -1,13 +1,20 @@
+from typing import TYPE_CHECKING, Optional
+
 import pygame as pg
 
 from mvpygame.sprite import Group
 from mvpygame.subject import MutableSubject
 
+if TYPE_CHECKING:
+    from mvpygame.capture import FrameCapture
+
 
 class GameView:
-    def __init__(self, surface: pg.Surface):
+    def __init__(self, surface: pg.Surface, capture: Optional["FrameCapture"] = None):
         self.surface = surface
+        self.capture = capture
         self.size_subject = MutableSubject[tuple[int, int]](surface.get_size())
+        self.frame_subject = MutableSubject[int](0)
 
     def draw(self, sprites: Group) -> None:
         """Draw the sprites, based on the coordinate origin"""
@@ -25,3 +32,11 @@ class GameView:
         self.clear()
         self.draw(sprites)
         pg.display.flip()
+        if self.capture:
+            self.capture.write(self.surface)
+        self.frame_subject.value += 1
+
+    def close(self) -> None:
+        """Release the view resources"""
+        if self.capture:
+            self.capture.close()